@@ -128,6 +128,21 @@ if __name__ == "__main__":
             help="if set, the corresponding plot will be renewed using \
 plot_template_single_layer",
             )
+    # native extension module
+    parser.add_option("--native",
+            type="choice",
+            choices=["cext", "cffi", "cython"],
+            dest="native",
+            help="if set, a native extension module stub (cext, cffi or \
+cython) with a pure-python fallback will be added to the --py_pkg package",
+            )
+    # bytecode bundle
+    parser.add_option("--bundle",
+            action="store_true",
+            dest="bundle",
+            help="if set, a makefile with a 'bundle' target building a \
+precompiled zipapp will be created",
+            )
 
     # PARSE ARGS
     (options, args) = parser.parse_args()
@@ -142,6 +157,10 @@ plot_template_single_layer",
     # APP NAME
     if not args:
         parser.error("Application name not specified!")
+    # NATIVE EXTENSION
+    # (the extension module lives inside the package)
+    if options.native and not options.py_pkg:
+        parser.error("--native requires --py_pkg!")
 
     app_name = args[0]
 
@@ -112,6 +112,185 @@ class Python_Project_Creator(Project_Creator.Project_Creator):
             return 0
 
 
+    def __create_native(self, app_name, pkg_dir, native):
+
+        ##############################
+        # READ TEMPLATE FILES
+        ##############################
+
+        template_select = self._load_template(
+                self.TEMPLATES_ABS_PATH + "/template_native_select.py",
+                app_name, pkg_dir)
+
+        template_setup = self._load_template(
+                self.TEMPLATES_ABS_PATH + "/template_native_setup.py",
+                app_name, pkg_dir)
+
+        ##############################
+        # ADAPT
+        ##############################
+        # basically handle the special template placeholders (indicated by
+        # '_TT_*_TT_' instead of '_T_*_T_')
+
+        select_out = []
+
+        for line in template_select:
+
+            # NATIVE IMPORT
+            if re.match(r'.*_TT_NATIVE_IMPORT_TT_.*', line):
+                if native == "cffi":
+                    # cffi only exposes raw C functions, wrap them such that
+                    # they take the same arguments as the fallback
+                    select_out.extend([
+                        "    from ._native import ffi, lib\n",
+                        "\n",
+                        "    def dot(a, b):\n",
+                        "        if len(a) != len(b):\n",
+                        "            raise ValueError(\"dot() arguments must have the same length\")\n",
+                        "        return lib.dot(ffi.new(\"double[]\", a),\n",
+                        "                       ffi.new(\"double[]\", b), len(a))\n",
+                        "\n",
+                    ])
+                else:
+                    select_out.extend([
+                        "    from ._native import dot\n",
+                    ])
+
+            # NOTHING SPECIAL
+            # -> copy the line over
+            else:
+                select_out.append(line)
+
+        setup_out = []
+
+        for line in template_setup:
+
+            # BUILD BACKEND IMPORT
+            if re.match(r'.*_TT_NATIVE_SETUP_IMPORT_TT_.*', line):
+                if native == "cext":
+                    setup_out.extend([
+                        "from setuptools import Extension\n",
+                    ])
+                elif native == "cython":
+                    setup_out.extend([
+                        "from setuptools import Extension\n",
+                        "from Cython.Build import cythonize\n",
+                    ])
+                else:
+                    pass
+
+            # EXTENSION MODULE
+            elif re.match(r'.*_TT_NATIVE_SETUP_EXT_TT_.*', line):
+                if native == "cext":
+                    setup_out.extend([
+                        "    ext_modules=[\n",
+                        f"        Extension(\"{pkg_dir}._native\",\n",
+                        f"                  sources=[\"{pkg_dir}/_native.c\"],\n",
+                        "                  extra_compile_args=[\"-O3\"]),\n",
+                        "    ],\n",
+                    ])
+                elif native == "cython":
+                    setup_out.extend([
+                        "    ext_modules=cythonize([\n",
+                        f"        Extension(\"{pkg_dir}._native\",\n",
+                        f"                  sources=[\"{pkg_dir}/_native.pyx\"],\n",
+                        "                  extra_compile_args=[\"-O3\"]),\n",
+                        "    ]),\n",
+                    ])
+                elif native == "cffi":
+                    setup_out.extend([
+                        "    setup_requires=[\"cffi\"],\n",
+                        "    install_requires=[\"cffi\"],\n",
+                        f"    cffi_modules=[\"{pkg_dir}/_native_build.py:ffibuilder\"],\n",
+                    ])
+
+            # NOTHING SPECIAL
+            # -> copy the line over
+            else:
+                setup_out.append(line)
+
+        ##############################
+        # WRITE PROJECT FILES
+        ##############################
+
+        # (the package directory is created by __create_init)
+        if native == "cext":
+            l_native_src = [("template_native.c", "_native.c")]
+        elif native == "cython":
+            l_native_src = [("template_native.pyx", "_native.pyx")]
+        elif native == "cffi":
+            l_native_src = [("template_native_cffi_build.py", "_native_build.py")]
+        l_native_src.append(
+                ("template_native_fallback.py", "_native_fallback.py"))
+
+        for f_template, f_project in l_native_src:
+            template = self._load_template(
+                    self.TEMPLATES_ABS_PATH + "/" + f_template, app_name,
+                    pkg_dir)
+            with open (pkg_dir + "/" + f_project, "w") as f_out:
+                f_out.writelines(template)
+
+        with open (pkg_dir + "/native.py", "w") as f_out:
+            f_out.writelines(select_out)
+
+        with open ("setup.py", "w") as f_out:
+            f_out.writelines(setup_out)
+
+        for f_template, f_project in [
+                ("template_test_native.py", "test_native.py"),
+                ("template_bench_native.py", "bench_native.py"),
+                ]:
+            template = self._load_template(
+                    self.TEMPLATES_ABS_PATH + "/" + f_template, app_name,
+                    pkg_dir)
+            with open (f_project, "w") as f_out:
+                f_out.writelines(template)
+
+        return 0
+
+
+    def __create_bundle(self, app_name, pkg_dir):
+
+        ##############################
+        # READ TEMPLATE FILES
+        ##############################
+
+        template_makefile = self._load_template(
+                self.TEMPLATES_ABS_PATH + "/template_makefile", app_name,
+                pkg_dir)
+
+        ##############################
+        # ADAPT
+        ##############################
+        # basically handle the special template placeholders (indicated by
+        # '_TT_*_TT_' instead of '_T_*_T_')
+
+        # without a package, PKG_DIR stays empty and the makefile skips it
+        makefile_out = list(map(
+            lambda s: s.replace("_TT_PKG_DIR_TT_", pkg_dir or ""),
+            template_makefile
+            ))
+
+        ##############################
+        # WRITE PROJECT FILES
+        ##############################
+
+        with open ("makefile", "w") as f_out:
+            f_out.writelines(makefile_out)
+
+        for f_template, f_project in [
+                ("template_bundle_main.py", "bundle_main.py"),
+                ("template_check_startup.py", "check_startup.py"),
+                ]:
+            template = self._load_template(
+                    self.TEMPLATES_ABS_PATH + "/" + f_template, app_name,
+                    pkg_dir)
+            with open (f_project, "w") as f_out:
+                f_out.writelines(template)
+
+        return 0
+
+
     def __create_vimspector(self, app_name, pkg_dir):
 
         ##############################
@@ -143,8 +322,8 @@ class Python_Project_Creator(Project_Creator.Project_Creator):
 
 
     def create_project(self, app_name, 
-            py_pkg=False, vimspector=False, git=False,
-            **args):
+            py_pkg=False, vimspector=False, git=False, native=None,
+            bundle=False, **args):
         """Create a python project from the template in this directory
 
         :app_name:  The name for the application -> the main file
@@ -152,6 +331,13 @@ class Python_Project_Creator(Project_Creator.Project_Creator):
         within the project directory that gets imported by the top level file.  
         If a string, the directory is named after the string, if True, the 
         directory is named "src". If False or empty, no directory is created
+        :native:    "cext", "cffi", "cython" or None; If given, a native
+        extension module stub of that flavour is added to the package, along
+        with a setup.py to build it, a pure-python fallback, an equivalence
+        test and a micro-benchmark
+        :bundle:    If True, a makefile is created whose "bundle" target
+        precompiles the project and packs it into a bytecode-only zipapp,
+        along with a startup-time check script
         :returns:   TODO
 
         """
@@ -163,6 +349,10 @@ class Python_Project_Creator(Project_Creator.Project_Creator):
         # LAUNCH FILE CREATION
         self.__create_main(app_name, pkg_dir)
         self.__create_init(app_name, pkg_dir)
+        if native:
+            self.__create_native(app_name, pkg_dir, native)
+        if bundle:
+            self.__create_bundle(app_name, pkg_dir)
         if vimspector:
             self.__create_vimspector(app_name, pkg_dir)
         if git:
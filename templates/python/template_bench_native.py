@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# NATIVE MICRO-BENCHMARK
+#
+# Compare the native extension module of _T_SRC_DIR_T_ against the 
+# pure-python fallback.
+
+import random
+import timeit
+
+from _T_SRC_DIR_T_ import native
+from _T_SRC_DIR_T_ import _native_fallback
+
+N = 100000
+REPEAT = 5
+NUMBER = 20
+
+
+def bench(name, func, a, b):
+    t = min(timeit.repeat(lambda: func(a, b), repeat=REPEAT, number=NUMBER))
+    print(f"{name:10s} {t / NUMBER * 1e6:12.1f} us/call")
+    return t
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    a = [rng.random() for _ in range(N)]
+    b = [rng.random() for _ in range(N)]
+
+    t_fallback = bench("fallback", _native_fallback.dot, a, b)
+    if native.NATIVE:
+        t_native = bench("native", native.dot, a, b)
+        print(f"speedup    {t_fallback / t_native:12.1f}x")
+    else:
+        print("native extension module is not built, run "
+              "'python setup.py build_ext --inplace' first")
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+# BUNDLE ENTRY POINT
+#
+# __main__ of the _T_APP_NAME_T_ zipapp, runs the precompiled application. 
+# sys.path is stripped by the interpreter line (-I) of the archive.
+
+import runpy
+
+runpy.run_module("_T_APP_NAME_T_", run_name="__main__")
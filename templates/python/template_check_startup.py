@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# STARTUP-TIME CHECK
+#
+# Compare the cold start time of _T_APP_NAME_T_ run from source against the 
+# bytecode bundle (build it with 'make bundle' first). "source, no cache" 
+# neither reads nor writes __pycache__, as on a read-only install.
+
+import os, statistics, subprocess, sys, tempfile, time
+
+N = 20
+
+# (name, interpreter options, what to run; None for a bare interpreter start as 
+# reference, PYTHONPYCACHEPREFIX is pointed at an empty directory if no_cache)
+CANDIDATES = [
+        ("interpreter", [], None, False),
+        ("source", [], "_T_APP_NAME_T_.py", False),
+        ("source, no cache", ["-B"], "_T_APP_NAME_T_.py", True),
+        ("tree", ["-E", "-s"], "build/bundle/_T_APP_NAME_T_.pyc", False),
+        ("zipapp", ["-I"], "_T_APP_NAME_T_.pyz", False),
+        ]
+
+
+def measure(cmd, env):
+    l_times = []
+    for _ in range(N):
+        t_start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, env=env)
+        l_times.append(time.perf_counter() - t_start)
+    return l_times
+
+
+if __name__ == "__main__":
+    for name, l_opts, target, no_cache in CANDIDATES:
+        if target is None:
+            cmd = [sys.executable, "-c", "pass"]
+        elif os.path.exists(target):
+            cmd = [sys.executable] + l_opts + [target]
+        else:
+            print(f"{name:18s} {target} not found, run 'make bundle' first")
+            continue
+        with tempfile.TemporaryDirectory() as s_empty_dir:
+            env = dict(os.environ)
+            if no_cache:
+                env["PYTHONPYCACHEPREFIX"] = s_empty_dir
+            l_times = measure(cmd, env)
+        print(f"{name:18s} min {min(l_times) * 1e3:8.2f} ms    "
+              f"median {statistics.median(l_times) * 1e3:8.2f} ms")
@@ -0,0 +1,74 @@
+// NATIVE EXTENSION MODULE (C API)
+//
+// Native implementation of the hot paths of _T_SRC_DIR_T_. Every function in 
+// here must have a pure-python counterpart with the same signature and 
+// behaviour in _native_fallback.py, _T_SRC_DIR_T_/native.py picks whichever 
+// is available at import time.
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *
+native_dot(PyObject *self, PyObject *args)
+{
+    PyObject *a, *b;
+    PyObject *a_fast, *b_fast;
+    Py_ssize_t n, i;
+    double sum = 0.0;
+
+    if (!PyArg_ParseTuple(args, "OO", &a, &b))
+        return NULL;
+
+    a_fast = PySequence_Fast(a, "dot() arguments must be sequences");
+    if (a_fast == NULL)
+        return NULL;
+    b_fast = PySequence_Fast(b, "dot() arguments must be sequences");
+    if (b_fast == NULL) {
+        Py_DECREF(a_fast);
+        return NULL;
+    }
+
+    n = PySequence_Fast_GET_SIZE(a_fast);
+    if (n != PySequence_Fast_GET_SIZE(b_fast)) {
+        PyErr_SetString(PyExc_ValueError,
+                "dot() arguments must have the same length");
+        goto error;
+    }
+
+    for (i = 0; i < n; i++) {
+        double x = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(a_fast, i));
+        double y = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(b_fast, i));
+        if (PyErr_Occurred())
+            goto error;
+        sum += x * y;
+    }
+
+    Py_DECREF(a_fast);
+    Py_DECREF(b_fast);
+    return PyFloat_FromDouble(sum);
+
+error:
+    Py_DECREF(a_fast);
+    Py_DECREF(b_fast);
+    return NULL;
+}
+
+static PyMethodDef native_methods[] = {
+    {"dot", native_dot, METH_VARARGS,
+        "dot(a, b) -> float: dot product of two equally long sequences"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef native_module = {
+    PyModuleDef_HEAD_INIT,
+    "_native",
+    "Native implementation of the _T_SRC_DIR_T_ hot paths",
+    -1,
+    native_methods
+};
+
+PyMODINIT_FUNC
+PyInit__native(void)
+{
+    return PyModule_Create(&native_module);
+}
@@ -0,0 +1,21 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+# NATIVE EXTENSION MODULE (CYTHON)
+#
+# Native implementation of the hot paths of _T_SRC_DIR_T_. Every function in 
+# here must have a pure-python counterpart with the same signature and 
+# behaviour in _native_fallback.py, _T_SRC_DIR_T_/native.py picks whichever 
+# is available at import time.
+
+def dot(a, b):
+    """dot(a, b) -> float: dot product of two equally long sequences"""
+    cdef Py_ssize_t i, n = len(a)
+    cdef double s = 0.0
+
+    if n != len(b):
+        raise ValueError("dot() arguments must have the same length")
+
+    for i in range(n):
+        s += <double>a[i] * <double>b[i]
+
+    return s
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+# NATIVE EXTENSION MODULE (CFFI)
+#
+# cffi build script for the native implementation of the hot paths of 
+# _T_SRC_DIR_T_. It is picked up by setup.py (cffi_modules), but can also be 
+# run on its own. Every function in here must have a pure-python counterpart 
+# with the same signature and behaviour in _native_fallback.py, 
+# _T_SRC_DIR_T_/native.py picks whichever is available at import time.
+
+from cffi import FFI
+
+ffibuilder = FFI()
+
+ffibuilder.cdef("""
+    double dot(const double *a, const double *b, size_t n);
+""")
+
+ffibuilder.set_source("_T_SRC_DIR_T_._native",
+"""
+    static double dot(const double *a, const double *b, size_t n)
+    {
+        double sum = 0.0;
+        size_t i;
+        for (i = 0; i < n; i++)
+            sum += a[i] * b[i];
+        return sum;
+    }
+""",
+    extra_compile_args=["-O3"])
+
+
+if __name__ == "__main__":
+    ffibuilder.compile(verbose=True)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+# PURE-PYTHON FALLBACK
+#
+# Reference implementation of the native extension module of _T_SRC_DIR_T_.  
+# Used whenever the extension is not built (or cannot be imported) and as the 
+# ground truth for test_native.py. Keep the API in sync with the native 
+# module.
+
+
+def dot(a, b):
+    """dot(a, b) -> float: dot product of two equally long sequences"""
+    if len(a) != len(b):
+        raise ValueError("dot() arguments must have the same length")
+
+    s = 0.0
+    for x, y in zip(a, b):
+        s += x * y
+
+    return s
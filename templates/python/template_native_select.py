@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+# NATIVE MODULE SELECTION
+#
+# Import the native extension module if it is built, otherwise fall back to 
+# the pure-python implementation with the same API. NATIVE tells which one is 
+# in use.
+
+try:
+    # _TT_NATIVE_IMPORT_TT_
+    NATIVE = True
+except ImportError:
+    from ._native_fallback import dot
+    NATIVE = False
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+# NATIVE EXTENSION BUILD
+#
+# Build the native extension module of _T_SRC_DIR_T_ in place:
+#   python setup.py build_ext --inplace
+# Without it, _T_SRC_DIR_T_.native falls back to the pure-python 
+# implementation.
+
+from setuptools import setup
+# _TT_NATIVE_SETUP_IMPORT_TT_
+
+setup(
+    name="_T_APP_NAME_T_",
+    packages=["_T_SRC_DIR_T_"],
+    # _TT_NATIVE_SETUP_EXT_TT_
+)
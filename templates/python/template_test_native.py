@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# NATIVE EQUIVALENCE TEST
+#
+# Check that the native extension module of _T_SRC_DIR_T_ behaves exactly like 
+# the pure-python fallback. Run with:
+#   python -m unittest test_native
+
+import random
+import unittest
+
+from _T_SRC_DIR_T_ import native
+from _T_SRC_DIR_T_ import _native_fallback
+
+
+class Test_Native(unittest.TestCase):
+
+    def assert_equivalent(self, a, b):
+        """native and fallback return the same value or raise the same error"""
+        try:
+            expected = _native_fallback.dot(a, b)
+        except Exception as e:
+            with self.assertRaises(type(e)):
+                native.dot(a, b)
+        else:
+            self.assertAlmostEqual(native.dot(a, b), expected)
+
+    # FALLBACK
+    # (runs whether the extension is built or not)
+
+    def test_fallback_dot(self):
+        self.assertEqual(_native_fallback.dot([1, 2, 3], (4.0, 5.0, 6.0)), 32.0)
+        self.assertEqual(_native_fallback.dot([], []), 0.0)
+
+    def test_fallback_dot_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            _native_fallback.dot([1.0, 2.0], [1.0])
+
+    def test_fallback_dot_bad_type(self):
+        with self.assertRaises(TypeError):
+            _native_fallback.dot(["1.5"], [2])
+
+    # NATIVE VS FALLBACK
+
+    @unittest.skipUnless(native.NATIVE, "native extension module is not built")
+    def test_dot_random(self):
+        rng = random.Random(0)
+        for n in [0, 1, 2, 7, 1000]:
+            a = [rng.uniform(-1, 1) for _ in range(n)]
+            b = [rng.uniform(-1, 1) for _ in range(n)]
+            self.assert_equivalent(a, b)
+
+    @unittest.skipUnless(native.NATIVE, "native extension module is not built")
+    def test_dot_int_and_tuple(self):
+        self.assert_equivalent([1, 2, 3], [4, 5, 6])
+        self.assert_equivalent((1.5, -2), (2, 0.25))
+        self.assert_equivalent([1, 2.5], (3, 4))
+
+    @unittest.skipUnless(native.NATIVE, "native extension module is not built")
+    def test_dot_length_mismatch(self):
+        self.assert_equivalent([1.0, 2.0], [1.0])
+
+    @unittest.skipUnless(native.NATIVE, "native extension module is not built")
+    def test_dot_bad_type(self):
+        self.assert_equivalent(["1.5"], [2])
+        self.assert_equivalent([None], [1.0])
+        self.assert_equivalent([[1.0]], [2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()